@@ -0,0 +1,69 @@
+from fastapi import HTTPException, Depends, Request, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import Optional
+from datetime import datetime, timedelta
+
+from config import SECRET_KEY, ALGORITHM
+from database import db
+
+# bcrypt and jose are imported on first use so that deployments and workers
+# which never authenticate a request do not pay for loading them.
+
+# Security
+security = HTTPBearer()
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.utcnow() + expires_delta
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=15)
+    to_encode.update({"exp": expire})
+    from jose import jwt
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    import bcrypt
+    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+def get_password_hash(password: str) -> str:
+    import bcrypt
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+def decode_access_token(token: str) -> Optional[dict]:
+    """Return the claims of a valid access token, None for an invalid or expired one"""
+    from jose import JWTError, jwt
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+
+async def get_current_user(request: Request, credentials: HTTPAuthorizationCredentials = Depends(security)):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    # The rate limiter has usually decoded this token already
+    token, payload = getattr(request.state, "access_token_claims", (None, None))
+    if token != credentials.credentials:
+        payload = decode_access_token(credentials.credentials)
+    email = payload.get("sub") if payload else None
+    if email is None:
+        raise credentials_exception
+    
+    user = await db.users.find_one({"email": email})
+    if user is None:
+        raise credentials_exception
+    return user
+
+async def get_current_active_user(current_user: dict = Depends(get_current_user)):
+    if not current_user.get("is_active"):
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
+async def get_current_subscribed_user(current_user: dict = Depends(get_current_active_user)):
+    if current_user.get("subscription_status") != "active":
+        raise HTTPException(status_code=403, detail="Active subscription required")
+    return current_user
@@ -0,0 +1,99 @@
+"""Measure API cold start: import time and resident memory of one worker.
+
+Every run imports the app in a fresh interpreter, the way a new uvicorn
+worker does, and reports the median import time, the peak RSS and which
+heavy dependencies got loaded along the way.
+
+    python benchmark_startup.py --runs 5 --max-import-ms 1500 --max-rss-mb 120
+
+Exits non-zero when a budget is exceeded or a lazily loaded dependency is
+imported at startup. tests/test_startup.py runs the same checks in the
+test suite.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+BACKEND_DIR = Path(__file__).parent
+
+# Only needed by specific routes or jobs, must not be imported at startup
+LAZY_MODULES = ["qrcode", "PIL", "bcrypt", "jose", "emergentintegrations", "pandas", "numpy", "boto3"]
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import server
+import_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({
+    "import_ms": import_ms,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "loaded": [m for m in %r if m in sys.modules],
+}))
+""" % (LAZY_MODULES,)
+
+def measure_once(env: dict) -> dict:
+    process = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Importing the app failed:\n{process.stderr}")
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+def run_benchmark(runs: int = 5, disabled_features: Optional[str] = None) -> dict:
+    env = dict(os.environ)
+    env.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    env.setdefault("DB_NAME", "benchmark")
+    if disabled_features is not None:
+        env["DISABLED_FEATURES"] = disabled_features
+
+    samples = [measure_once(env) for _ in range(runs)]
+    return {
+        "runs": runs,
+        "import_ms_median": round(statistics.median(s["import_ms"] for s in samples), 1),
+        "import_ms_max": round(max(s["import_ms"] for s in samples), 1),
+        "rss_mb_max": round(max(s["rss_mb"] for s in samples), 1),
+        "lazy_modules_loaded": sorted({m for s in samples for m in s["loaded"]}),
+    }
+
+def check_budgets(result: dict, max_import_ms: Optional[float] = None, max_rss_mb: Optional[float] = None) -> List[str]:
+    """Return a description of every budget the benchmark result exceeds"""
+    failures = []
+    if result["lazy_modules_loaded"]:
+        failures.append(f"lazy modules imported at startup: {', '.join(result['lazy_modules_loaded'])}")
+    if max_import_ms is not None and result["import_ms_median"] > max_import_ms:
+        failures.append(f"median import time {result['import_ms_median']}ms > {max_import_ms}ms")
+    if max_rss_mb is not None and result["rss_mb_max"] > max_rss_mb:
+        failures.append(f"peak RSS {result['rss_mb_max']}MB > {max_rss_mb}MB")
+    return failures
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-rss-mb", type=float, default=None)
+    parser.add_argument("--disabled-features", default=None, help="Overrides DISABLED_FEATURES, e.g. subscription,admin")
+    args = parser.parse_args()
+
+    try:
+        result = run_benchmark(args.runs, args.disabled_features)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=2))
+
+    failures = check_budgets(result, args.max_import_ms, args.max_rss_mb)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
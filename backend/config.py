@@ -0,0 +1,34 @@
+from dotenv import load_dotenv
+from pathlib import Path
+import os
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# JWT Configuration
+SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-here-change-in-production')
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 30
+
+# Stripe Configuration
+STRIPE_API_KEY = os.environ.get('STRIPE_API_KEY')
+SUBSCRIPTION_PRICE = 9.99  # €9.99/month
+
+# Public menu payload cache (per menu and locale, validated against the menu version),
+# bounded by the approximate serialized size of the cached payloads
+PUBLIC_MENU_CACHE_MAX_BYTES = int(os.environ.get('PUBLIC_MENU_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))
+
+# Background job runner configuration
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', '4'))
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', '5'))
+JOB_LEASE_SECONDS = int(os.environ.get('JOB_LEASE_SECONDS', '300'))
+JOB_POLL_INTERVAL = float(os.environ.get('JOB_POLL_INTERVAL', '1.0'))
+JOB_RETENTION_SECONDS = int(os.environ.get('JOB_RETENTION_SECONDS', str(7 * 24 * 3600)))  # finished jobs are then removed
+
+# Rate limiting / load shedding configuration
+RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+SHED_MAX_IN_FLIGHT = int(os.environ.get('SHED_MAX_IN_FLIGHT', '200'))
+SHED_MAX_POOL_WAIT_MS = float(os.environ.get('SHED_MAX_POOL_WAIT_MS', '250'))
+
+# Features whose routers are not mounted in this deployment, e.g. "subscription,admin"
+DISABLED_FEATURES = {f.strip() for f in os.environ.get('DISABLED_FEATURES', '').split(',') if f.strip()}
@@ -0,0 +1,70 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+import os
+import threading
+import time
+
+import config  # noqa: F401  (loads .env before reading MONGO_URL)
+
+class PoolWaitMonitor(monitoring.ConnectionPoolListener):
+    """Track how long requests wait to check a connection out of the Mongo pool"""
+
+    def __init__(self, smoothing: float = 0.2, max_age: float = 5.0):
+        self.smoothing = smoothing
+        self.max_age = max_age
+        self.average_ms = 0.0  # exponentially weighted moving average
+        self.updated = 0.0
+        self._local = threading.local()
+
+    @property
+    def wait_ms(self) -> float:
+        # Without recent checkouts the pool is idle, so a stale average must not keep shedding
+        if time.monotonic() - self.updated > self.max_age:
+            return 0.0
+        return self.average_ms
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.monotonic()
+
+    def connection_checked_out(self, event):
+        started = getattr(self._local, "started", None)
+        if started is None:
+            return
+        now = time.monotonic()
+        self.average_ms += self.smoothing * ((now - started) * 1000 - self.average_ms)
+        self.updated = now
+        self._local.started = None
+
+    def connection_check_out_failed(self, event):
+        self._local.started = None
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_checked_in(self, event):
+        pass
+
+pool_monitor = PoolWaitMonitor()
+
+# MongoDB connection
+mongo_url = os.environ['MONGO_URL']
+client = AsyncIOMotorClient(mongo_url, event_listeners=[pool_monitor])
+db = client[os.environ['DB_NAME']]
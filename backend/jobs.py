@@ -0,0 +1,172 @@
+from pymongo import ReturnDocument
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+import asyncio
+import logging
+
+from config import JOB_WORKERS, JOB_LEASE_SECONDS, JOB_POLL_INTERVAL, JOB_RETENTION_SECONDS
+from database import db
+from models import Job
+
+logger = logging.getLogger(__name__)
+
+JOB_HANDLERS: Dict[str, Any] = {}
+job_wakeup = asyncio.Event()
+job_workers: List[asyncio.Task] = []
+
+def job_handler(job_type: str):
+    """Register a coroutine as the handler for a job type, handlers must be idempotent"""
+    def decorator(func):
+        JOB_HANDLERS[job_type] = func
+        return func
+    return decorator
+
+async def enqueue_job(job_type: str, payload: Dict[str, Any], user_id: Optional[str] = None) -> Job:
+    if job_type not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job type: {job_type}")
+    job = Job(type=job_type, payload=payload, user_id=user_id)
+    await db.jobs.insert_one(job.dict())
+    job_wakeup.set()
+    return job
+
+async def claim_job() -> Optional[dict]:
+    """Atomically lease the next due job, including jobs whose worker died mid-run"""
+    now = datetime.utcnow()
+    
+    # A job that kept taking its worker down with it has used up its attempts
+    await db.jobs.update_many(
+        {
+            "status": "running",
+            "locked_until": {"$lt": now},
+            "$expr": {"$gte": ["$attempts", "$max_attempts"]}
+        },
+        {
+            "$set": {
+                "status": "failed",
+                "error": "Lease expired on the last attempt",
+                "locked_until": None,
+                "expire_at": now + timedelta(seconds=JOB_RETENTION_SECONDS),
+                "updated_at": now
+            }
+        }
+    )
+    
+    return await db.jobs.find_one_and_update(
+        {
+            # Jobs of features disabled in this deployment are left to workers that handle them
+            "type": {"$in": list(JOB_HANDLERS)},
+            "$or": [
+                {"status": "queued", "run_at": {"$lte": now}},
+                {
+                    "status": "running",
+                    "locked_until": {"$lt": now},
+                    "$expr": {"$lt": ["$attempts", "$max_attempts"]}
+                }
+            ]
+        },
+        {
+            "$set": {
+                "status": "running",
+                "locked_until": now + timedelta(seconds=JOB_LEASE_SECONDS),
+                "updated_at": now
+            },
+            "$inc": {"attempts": 1}
+        },
+        sort=[("run_at", 1)],
+        return_document=ReturnDocument.AFTER
+    )
+
+def job_lease(job: dict) -> dict:
+    """Filter matching a job only while this attempt still holds its lease"""
+    return {"id": job["id"], "status": "running", "attempts": job["attempts"]}
+
+async def renew_job_lease(job: dict):
+    """Extend the lease of a running job so a slow handler is not claimed a second time"""
+    while True:
+        await asyncio.sleep(JOB_LEASE_SECONDS / 3)
+        now = datetime.utcnow()
+        try:
+            result = await db.jobs.update_one(
+                job_lease(job),
+                {"$set": {"locked_until": now + timedelta(seconds=JOB_LEASE_SECONDS), "updated_at": now}}
+            )
+        except Exception:
+            logger.exception(f"Could not renew the lease of job {job['id']}")
+            continue
+        if not result.matched_count:
+            logger.warning(f"Job {job['id']} lost its lease on attempt {job['attempts']}")
+            return
+
+async def run_job(job: dict):
+    handler = JOB_HANDLERS.get(job["type"])
+    heartbeat = asyncio.create_task(renew_job_lease(job))
+    try:
+        if handler is None:
+            raise ValueError(f"Unknown job type: {job['type']}")
+        result = await handler(**job["payload"])
+    except Exception as e:
+        logger.exception(f"Job {job['id']} ({job['type']}) failed on attempt {job['attempts']}")
+        update = {"error": str(e), "locked_until": None, "updated_at": datetime.utcnow()}
+        if handler is not None and job["attempts"] < job["max_attempts"]:
+            # Exponential backoff: 2s, 4s, 8s, ...
+            update["status"] = "queued"
+            update["run_at"] = datetime.utcnow() + timedelta(seconds=2 ** job["attempts"])
+        else:
+            update["status"] = "failed"
+            update["expire_at"] = datetime.utcnow() + timedelta(seconds=JOB_RETENTION_SECONDS)
+        await db.jobs.update_one(job_lease(job), {"$set": update})
+        return
+    finally:
+        heartbeat.cancel()
+    
+    await db.jobs.update_one(
+        job_lease(job),
+        {
+            "$set": {
+                "status": "succeeded",
+                "result": result,
+                "error": None,
+                "locked_until": None,
+                "expire_at": datetime.utcnow() + timedelta(seconds=JOB_RETENTION_SECONDS),
+                "updated_at": datetime.utcnow()
+            }
+        }
+    )
+
+async def job_worker():
+    while True:
+        try:
+            job = await claim_job()
+        except Exception:
+            logger.exception("Could not claim job")
+            job = None
+        
+        if job is None:
+            # Sleep until a job is enqueued in this process or the poll interval elapses
+            job_wakeup.clear()
+            try:
+                await asyncio.wait_for(job_wakeup.wait(), timeout=JOB_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        
+        try:
+            await run_job(job)
+        except Exception:
+            # Recording the outcome failed, the job is retried once its lease expires
+            logger.exception(f"Could not record the outcome of job {job['id']}")
+
+async def start_job_workers():
+    await db.jobs.create_index([("status", 1), ("run_at", 1)])
+    await db.jobs.create_index("id", unique=True)
+    # Finished jobs are only kept for JOB_RETENTION_SECONDS, queued and running ones have no expire_at
+    await db.jobs.create_index("expire_at", expireAfterSeconds=0)
+    for _ in range(JOB_WORKERS):
+        job_workers.append(asyncio.create_task(job_worker()))
+
+async def stop_job_workers():
+    # Running jobs are abandoned and picked up again once their lease expires
+    for worker in job_workers:
+        worker.cancel()
+    await asyncio.gather(*job_workers, return_exceptions=True)
+    job_workers.clear()
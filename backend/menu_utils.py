@@ -0,0 +1,321 @@
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+from typing import List, Optional, Dict
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from io import BytesIO
+import base64
+import json
+
+from config import PUBLIC_MENU_CACHE_MAX_BYTES
+from database import db
+
+# A reserved menu version not published after this long belongs to a dead request
+MENU_VERSION_PENDING_TIMEOUT = 60.0
+
+def generate_qr_code(data: str) -> str:
+    """Generate QR code and return as base64 encoded string"""
+    import qrcode  # Pulls in PIL, only needed by the QR rendering job
+    
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    
+    img = qr.make_image(fill_color="black", back_color="white")
+    buffered = BytesIO()
+    img.save(buffered, format="PNG")
+    img_str = base64.b64encode(buffered.getvalue()).decode()
+    return f"data:image/png;base64,{img_str}"
+
+def live_pending_versions(pending: List[dict], now: datetime) -> List[int]:
+    cutoff = now - timedelta(seconds=MENU_VERSION_PENDING_TIMEOUT)
+    return [entry["v"] for entry in pending if entry["at"] > cutoff]
+
+def published_menu_version(menu: dict) -> int:
+    """Highest menu version whose changes, and all earlier ones, are written
+
+    This is the low watermark below every pending reservation. Reservations
+    older than MENU_VERSION_PENDING_TIMEOUT belong to dead requests and are ignored.
+    """
+    pending = live_pending_versions(menu.get("pending_versions", []), datetime.utcnow())
+    if pending:
+        return min(pending) - 1
+    return menu.get("reserved_version", menu.get("version", 0))
+
+async def reserve_menu_version(menu_id: str) -> Optional[int]:
+    """Reserve the version number for a menu change that is about to be written
+
+    The number stays pending, and hidden from readers, until publish_menu_version.
+    Returns None when the menu does not exist.
+    """
+    now = datetime.utcnow()
+    menu = await db.menus.find_one_and_update(
+        {"id": menu_id},
+        [
+            {"$set": {"reserved_version": {"$add": [
+                {"$ifNull": ["$reserved_version", {"$ifNull": ["$version", 0]}]}, 1
+            ]}}},
+            {"$set": {"pending_versions": {"$concatArrays": [
+                {"$ifNull": ["$pending_versions", []]},
+                [{"v": "$reserved_version", "at": now}]
+            ]}}}
+        ],
+        return_document=ReturnDocument.AFTER
+    )
+    return menu["reserved_version"] if menu else None
+
+async def publish_menu_version(menu_id: str, version: int):
+    """Release a reservation once its change is written, or has failed to be
+
+    Dead reservations are dropped on the way, and the stored ``version``
+    (returned to the dashboard) is moved to the new watermark in the same update.
+    """
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=MENU_VERSION_PENDING_TIMEOUT)
+    await db.menus.update_one(
+        {"id": menu_id},
+        [
+            {"$set": {"pending_versions": {"$filter": {
+                "input": {"$ifNull": ["$pending_versions", []]},
+                "cond": {"$and": [{"$ne": ["$$this.v", version]}, {"$gt": ["$$this.at", cutoff]}]}
+            }}}},
+            {"$set": {
+                "version": {"$cond": [
+                    {"$gt": [{"$size": "$pending_versions"}, 0]},
+                    {"$subtract": [{"$min": "$pending_versions.v"}, 1]},
+                    "$reserved_version"
+                ]},
+                "updated_at": now
+            }}
+        ]
+    )
+
+@asynccontextmanager
+async def menu_change(menu_id: str):
+    """Reserve a version for a change to a menu and publish it once the block exits"""
+    version = await reserve_menu_version(menu_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    try:
+        yield version
+    finally:
+        await publish_menu_version(menu_id, version)
+
+async def get_dish_changes(menu_id: str, since: int):
+    """Return dishes changed and dish ids deleted after the given menu version"""
+    dishes = await db.dishes.find(
+        {"menu_id": menu_id, "version": {"$gt": since}}, {"_id": 0}
+    ).to_list(1000)
+    tombstones = await db.dish_tombstones.find(
+        {"menu_id": menu_id, "version": {"$gt": since}}, {"_id": 0}
+    ).to_list(1000)
+    return dishes, [t["dish_id"] for t in tombstones]
+
+def normalize_locale(locale: str) -> str:
+    return locale.strip().lower().replace("_", "-")
+
+def negotiate_locale(accept_language: Optional[str], menu: dict) -> str:
+    """Pick the best locale for an Accept-Language header among those the menu serves"""
+    default_locale = normalize_locale(menu.get("default_locale", "en"))
+    available = set(menu.get("available_locales", [])) | {default_locale}
+    if not accept_language:
+        return default_locale
+    
+    candidates = []
+    for index, part in enumerate(accept_language.split(",")):
+        tag, *params = part.split(";")
+        quality = 1.0
+        try:
+            for param in params:
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    quality = float(value)
+        except ValueError:
+            continue
+        if tag.strip() and quality > 0:
+            candidates.append((-quality, index, normalize_locale(tag)))
+    
+    for _, _, tag in sorted(candidates):
+        if tag == "*":
+            return default_locale
+        if tag in available:
+            return tag
+        # Fall back from a regional variant to its language, e.g. "fr-ch" -> "fr"
+        language = tag.split("-")[0]
+        if language in available:
+            return language
+    return default_locale
+
+# Bookkeeping fields of menu and dish documents that are not part of the public payload
+INTERNAL_FIELDS = ["_id", "translations", "available_locales", "reserved_version", "pending_versions", "meta_version"]
+
+def localize(document: dict, locale: str, fields: List[str]) -> dict:
+    """Return a copy of a menu or dish with translated fields, without the translation table"""
+    translation = {}
+    for key, value in document.get("translations", {}).items():
+        if normalize_locale(key) == locale:
+            translation = value
+            break
+    
+    localized = {k: v for k, v in document.items() if k not in INTERNAL_FIELDS}
+    for field in fields:
+        if translation.get(field):
+            localized[field] = translation[field]
+    return localized
+
+def localize_menu(menu: dict, locale: str) -> dict:
+    return localize(menu, locale, ["name"])
+
+def localize_dish(dish: dict, locale: str) -> dict:
+    return localize(dish, locale, ["name", "description"])
+
+def public_menu(menu: dict, locale: str) -> dict:
+    """Localized menu for diners, without the QR code they have just scanned"""
+    localized = localize_menu(menu, locale)
+    localized.pop("qr_code", None)
+    return localized
+
+def public_restaurant(restaurant: dict) -> dict:
+    """Restaurant for diners, with its logo linked instead of embedded"""
+    public = {k: v for k, v in restaurant.items() if k not in ["_id", "logo"]}
+    public["logo_url"] = None
+    if restaurant.get("logo"):
+        stamp = int(restaurant["updated_at"].timestamp()) if restaurant.get("updated_at") else 0
+        public["logo_url"] = f"/api/public/restaurant/{restaurant['id']}/logo?v={stamp}"
+    return public
+
+def public_dish(dish: dict, locale: str) -> dict:
+    """Localized dish for diners, with its image linked instead of embedded"""
+    localized = localize_dish(dish, locale)
+    localized["image_url"] = None
+    if localized.pop("image", None):
+        localized["image_url"] = f"/api/public/dish/{dish['id']}/image?v={dish.get('version', 0)}"
+    return localized
+
+def decode_data_url(data_url: Optional[str]) -> Optional[tuple]:
+    """Split a base64 data URL into its media type and bytes, None when it is not one"""
+    if not data_url or not data_url.startswith("data:"):
+        return None
+    header, _, data = data_url.partition(",")
+    params = header[len("data:"):].split(";")
+    if "base64" not in params[1:]:
+        return None
+    try:
+        return params[0] or "application/octet-stream", base64.b64decode(data)
+    except ValueError:
+        return None
+
+class PayloadCache:
+    """LRU cache of public payloads bounded by their approximate size in bytes
+
+    Entries are evicted one at a time from the least recently used end, so a
+    full cache never drops the payloads of every popular menu at once.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get(self, key: tuple) -> Optional[dict]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return entry[0]
+    
+    def put(self, key: tuple, payload: dict):
+        self.discard(key)
+        size = len(json.dumps(payload, default=str))
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (payload, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+    
+    def discard(self, key: tuple):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+    
+    def keys(self) -> List[tuple]:
+        return list(self.entries)
+
+public_menu_cache = PayloadCache(PUBLIC_MENU_CACHE_MAX_BYTES)
+
+async def refresh_public_menu_payloads(menu_id: str) -> Dict[str, dict]:
+    """Rebuild the stored public payload of a menu for every locale it serves"""
+    menu = await db.menus.find_one({"id": menu_id}, {"_id": 0})
+    if not menu:
+        return {}
+    restaurant = await db.restaurants.find_one({"id": menu["restaurant_id"]}, {"_id": 0})
+    if not restaurant:
+        return {}
+    dishes = await db.dishes.find({"menu_id": menu_id, "is_available": True}, {"_id": 0}).to_list(1000)
+    
+    default_locale = normalize_locale(menu.get("default_locale", "en"))
+    locales = {default_locale}
+    for document in [menu] + dishes:
+        locales.update(normalize_locale(key) for key in document.get("translations", {}))
+    
+    version = published_menu_version(menu)
+    payloads = {}
+    for locale in sorted(locales):
+        # Images stay out of the stored payload, which would otherwise hold a copy of
+        # every image per locale and could outgrow the 16MB document limit
+        payload = {
+            "menu": public_menu(menu, locale),
+            "restaurant": public_restaurant(restaurant),
+            "version": version,
+            "locale": locale,
+            "full": True,
+            "dishes": [public_dish(dish, locale) for dish in dishes],
+            "deleted": []
+        }
+        payloads[locale] = payload
+        await db.public_menu_payloads.update_one(
+            {"menu_id": menu_id, "locale": locale},
+            {"$set": {"version": version, "payload": payload, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+    
+    await db.public_menu_payloads.delete_many({"menu_id": menu_id, "locale": {"$nin": sorted(locales)}})
+    await db.menus.update_one({"id": menu_id}, {"$set": {"available_locales": sorted(locales)}})
+    return payloads
+
+async def get_public_menu_payload(menu: dict, locale: str) -> Optional[dict]:
+    """Serve a precomputed public payload, from process memory when the version still matches"""
+    version = published_menu_version(menu)
+    cache_key = (menu["id"], locale)
+    cached = public_menu_cache.get(cache_key)
+    if cached is not None and cached["version"] == version:
+        return cached
+    
+    stored = await db.public_menu_payloads.find_one({"menu_id": menu["id"], "locale": locale}, {"_id": 0})
+    if stored and stored["version"] == version:
+        payload = stored["payload"]
+    else:
+        # Missing or stale (menu written before payloads existed, or a concurrent write)
+        payloads = await refresh_public_menu_payloads(menu["id"])
+        payload = payloads.get(locale)
+        if payload is None:
+            return None
+    
+    public_menu_cache.put(cache_key, payload)
+    return payload
+
+async def delete_public_menu_payloads(menu_ids: List[str]):
+    await db.public_menu_payloads.delete_many({"menu_id": {"$in": menu_ids}})
+    for cache_key in [key for key in public_menu_cache.keys() if key[0] in menu_ids]:
+        public_menu_cache.discard(cache_key)
@@ -0,0 +1,132 @@
+from pydantic import BaseModel, Field, EmailStr
+from typing import List, Optional, Dict, Any
+import uuid
+from datetime import datetime
+
+from config import JOB_MAX_ATTEMPTS
+
+class User(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    email: EmailStr
+    password_hash: str
+    is_active: bool = True
+    is_admin: bool = False
+    subscription_status: str = "inactive"  # inactive, active, canceled
+    subscription_session_id: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class UserRegister(BaseModel):
+    email: EmailStr
+    password: str
+
+class UserLogin(BaseModel):
+    email: EmailStr
+    password: str
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+    user: Dict[str, Any]
+
+class Restaurant(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    name: str
+    address: str
+    phone: str
+    logo: Optional[str] = None  # base64 encoded image
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class RestaurantCreate(BaseModel):
+    name: str
+    address: str
+    phone: str
+    logo: Optional[str] = None
+
+class MenuTranslation(BaseModel):
+    name: str
+
+class Menu(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    restaurant_id: str
+    name: str
+    qr_code: Optional[str] = None  # base64 encoded QR code
+    is_active: bool = True
+    version: int = 0  # bumped on every menu/dish change, used for delta sync
+    meta_version: int = 0  # menu version at which the menu or its restaurant last changed
+    default_locale: str = "en"  # locale of name/description fields
+    translations: Dict[str, MenuTranslation] = {}  # keyed by locale, e.g. "fr", "pt-br"
+    available_locales: List[str] = []  # every locale served by the public menu
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class MenuCreate(BaseModel):
+    restaurant_id: str
+    name: str
+    default_locale: str = "en"
+    translations: Dict[str, MenuTranslation] = {}
+
+class DishTranslation(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+class Dish(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    menu_id: str
+    name: str
+    description: str
+    price: float
+    image: Optional[str] = None  # base64 encoded image
+    options: List[str] = []
+    translations: Dict[str, DishTranslation] = {}  # keyed by locale
+    is_available: bool = True
+    version: int = 0  # menu version at which this dish last changed
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class DishCreate(BaseModel):
+    menu_id: str
+    name: str
+    description: str
+    price: float
+    image: Optional[str] = None
+    options: List[str] = []
+    translations: Dict[str, DishTranslation] = {}
+
+class DishDelta(BaseModel):
+    version: int
+    full: bool = False  # True when the client must replace its whole dish list
+    dishes: List[Dish] = []
+    deleted: List[str] = []
+
+class PaymentTransaction(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    session_id: str
+    amount: float
+    currency: str = "eur"
+    payment_status: str = "pending"
+    metadata: Dict[str, Any] = {}
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class SubscriptionRequest(BaseModel):
+    host_url: str
+
+class Job(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    type: str
+    payload: Dict[str, Any] = {}
+    user_id: Optional[str] = None
+    status: str = "queued"  # queued, running, succeeded, failed
+    attempts: int = 0
+    max_attempts: int = JOB_MAX_ATTEMPTS
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    run_at: datetime = Field(default_factory=datetime.utcnow)
+    locked_until: Optional[datetime] = None
+    expire_at: Optional[datetime] = None  # set once the job finished, removed by a TTL index
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,154 @@
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+from pydantic import BaseModel
+from typing import Dict, Optional
+from collections import OrderedDict, defaultdict
+import time
+
+from auth import decode_access_token
+from config import RATE_LIMIT_ENABLED, SHED_MAX_IN_FLIGHT, SHED_MAX_POOL_WAIT_MS
+from database import pool_monitor
+
+class RateLimitPolicy(BaseModel):
+    name: str
+    prefix: str
+    rate: float  # tokens refilled per second
+    burst: int  # bucket capacity
+    subscriber_multiplier: float = 4.0  # extra headroom for active subscribers
+
+# First matching prefix wins
+RATE_LIMIT_POLICIES = [
+    RateLimitPolicy(name="auth", prefix="/api/auth/", rate=0.5, burst=10, subscriber_multiplier=1.0),
+    RateLimitPolicy(name="public", prefix="/api/public/", rate=5, burst=30),
+    RateLimitPolicy(name="default", prefix="/api/", rate=20, burst=100),
+]
+
+# Never limited or shed: liveness probes and Stripe retries must always get through
+RATE_LIMIT_EXEMPT_PATHS = {"/api/health", "/api/webhook/stripe"}
+
+# Least recently used buckets are evicted beyond this, an evicted client simply starts full again
+MAX_TRACKED_BUCKETS = 10000
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def retry_after(self) -> int:
+        return max(1, int((1 - self.tokens) / self.rate) + 1)
+
+# Buckets and the in-flight count live in this process only. With several uvicorn
+# workers each one limits on its own, so the effective rate limits and shedding
+# thresholds of the deployment are these values times the number of workers.
+rate_limit_buckets: "OrderedDict[tuple, TokenBucket]" = OrderedDict()
+traffic_counters: Dict[str, int] = defaultdict(int)
+in_flight_requests = 0
+
+def match_rate_limit_policy(path: str) -> Optional[RateLimitPolicy]:
+    if path in RATE_LIMIT_EXEMPT_PATHS:
+        return None
+    for policy in RATE_LIMIT_POLICIES:
+        if path.startswith(policy.prefix):
+            return policy
+    return None
+
+def identify_client(scope: Scope):
+    """Return (client_key, is_subscriber) for a request
+
+    Only tokens carrying the subscribed claim get the subscriber tier: accounts
+    are free to register, so any other client is limited by address. The decoded
+    claims are kept in the request state for auth.get_current_user to reuse.
+    """
+    authorization = Headers(scope=scope).get("Authorization", "")
+    if authorization.startswith("Bearer "):
+        token = authorization[7:]
+        payload = decode_access_token(token)
+        scope.setdefault("state", {})["access_token_claims"] = (token, payload)
+        if payload and payload.get("sub") and payload.get("subscribed"):
+            return f"user:{payload['sub']}", True
+    
+    # X-Forwarded-For is client controlled and never read here. Uvicorn already
+    # rewrites the client address from it when the peer is a trusted proxy, as
+    # listed in --forwarded-allow-ips / FORWARDED_ALLOW_IPS.
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}", False
+
+def should_shed(is_subscriber: bool) -> bool:
+    """Shed anonymous traffic at the configured thresholds, subscribers only at twice them"""
+    factor = 2 if is_subscriber else 1
+    return (
+        in_flight_requests >= SHED_MAX_IN_FLIGHT * factor
+        or pool_monitor.wait_ms >= SHED_MAX_POOL_WAIT_MS * factor
+    )
+
+class RateLimitMiddleware:
+    """Plain ASGI middleware applying the rate limit policies and load shedding"""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        global in_flight_requests
+        
+        if not RATE_LIMIT_ENABLED or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        policy = match_rate_limit_policy(scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+        
+        traffic_counters["requests_total"] += 1
+        client_key, is_subscriber = identify_client(scope)
+        
+        if should_shed(is_subscriber):
+            traffic_counters["shed_subscriber" if is_subscriber else "shed_anonymous"] += 1
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server busy, please retry shortly"},
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+        
+        now = time.monotonic()
+        bucket_key = (policy.name, client_key)
+        bucket = rate_limit_buckets.get(bucket_key)
+        if bucket is not None:
+            rate_limit_buckets.move_to_end(bucket_key)
+        else:
+            while len(rate_limit_buckets) >= MAX_TRACKED_BUCKETS:
+                rate_limit_buckets.popitem(last=False)
+            multiplier = policy.subscriber_multiplier if is_subscriber else 1.0
+            bucket = TokenBucket(policy.rate * multiplier, policy.burst * multiplier)
+            rate_limit_buckets[bucket_key] = bucket
+        
+        if not bucket.take(now):
+            traffic_counters[f"rate_limited_{policy.name}"] += 1
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests"},
+                headers={"Retry-After": str(bucket.retry_after())},
+            )
+            await response(scope, receive, send)
+            return
+        
+        in_flight_requests += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            in_flight_requests -= 1
@@ -0,0 +1,59 @@
+from fastapi import APIRouter, HTTPException, Depends
+
+import rate_limit
+from auth import get_current_active_user
+from config import SHED_MAX_IN_FLIGHT, SHED_MAX_POOL_WAIT_MS
+from database import db, pool_monitor
+
+router = APIRouter()
+
+@router.get("/admin/users")
+async def get_all_users(current_user: dict = Depends(get_current_active_user)):
+    if not current_user.get("is_admin"):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    users = await db.users.find({}).to_list(1000)
+    for user in users:
+        user.pop("password_hash", None)
+    return users
+
+@router.get("/admin/stats")
+async def get_admin_stats(current_user: dict = Depends(get_current_active_user)):
+    if not current_user.get("is_admin"):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    total_users = await db.users.count_documents({})
+    active_subscribers = await db.users.count_documents({"subscription_status": "active"})
+    total_restaurants = await db.restaurants.count_documents({})
+    total_menus = await db.menus.count_documents({})
+    total_dishes = await db.dishes.count_documents({})
+    total_transactions = await db.payment_transactions.count_documents({})
+    queued_jobs = await db.jobs.count_documents({"status": "queued"})
+    failed_jobs = await db.jobs.count_documents({"status": "failed"})
+    
+    return {
+        "total_users": total_users,
+        "active_subscribers": active_subscribers,
+        "total_restaurants": total_restaurants,
+        "total_menus": total_menus,
+        "total_dishes": total_dishes,
+        "total_transactions": total_transactions,
+        "queued_jobs": queued_jobs,
+        "failed_jobs": failed_jobs
+    }
+
+@router.get("/admin/traffic")
+async def get_admin_traffic(current_user: dict = Depends(get_current_active_user)):
+    if not current_user.get("is_admin"):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return {
+        "counters": dict(rate_limit.traffic_counters),
+        "in_flight_requests": rate_limit.in_flight_requests,
+        "mongo_pool_wait_ms": round(pool_monitor.wait_ms, 2),
+        "tracked_buckets": len(rate_limit.rate_limit_buckets),
+        "thresholds": {
+            "max_in_flight": SHED_MAX_IN_FLIGHT,
+            "max_pool_wait_ms": SHED_MAX_POOL_WAIT_MS
+        }
+    }
@@ -0,0 +1,74 @@
+from fastapi import APIRouter, HTTPException, Depends, status
+from datetime import timedelta
+
+from auth import create_access_token, verify_password, get_password_hash, get_current_active_user
+from config import ACCESS_TOKEN_EXPIRE_MINUTES
+from database import db
+from models import User, UserRegister, UserLogin, Token
+
+router = APIRouter()
+
+@router.post("/auth/register", response_model=Token)
+async def register(user_data: UserRegister):
+    # Check if user already exists
+    existing_user = await db.users.find_one({"email": user_data.email})
+    if existing_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    # Create new user
+    password_hash = get_password_hash(user_data.password)
+    user = User(
+        email=user_data.email,
+        password_hash=password_hash
+    )
+    
+    await db.users.insert_one(user.dict())
+    
+    # Create access token
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={"sub": user.email, "subscribed": False}, expires_delta=access_token_expires
+    )
+    
+    user_dict = user.dict()
+    user_dict.pop("password_hash")
+    
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "user": user_dict
+    }
+
+@router.post("/auth/login", response_model=Token)
+async def login(user_data: UserLogin):
+    user = await db.users.find_one({"email": user_data.email})
+    if not user or not verify_password(user_data.password, user["password_hash"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={
+            "sub": user["email"],
+            # Read by the rate limiter to prioritise subscribers without a database lookup
+            "subscribed": user.get("subscription_status") == "active"
+        },
+        expires_delta=access_token_expires
+    )
+    
+    # Remove MongoDB ObjectId and other non-serializable fields
+    user_clean = {k: v for k, v in user.items() if k not in ["_id", "password_hash"]}
+    
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "user": user_clean
+    }
+
+@router.get("/auth/me")
+async def get_current_user_info(current_user: dict = Depends(get_current_active_user)):
+    user_clean = {k: v for k, v in current_user.items() if k not in ["_id", "password_hash"]}
+    return user_clean
@@ -0,0 +1,181 @@
+from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional, Union
+from datetime import datetime
+
+from auth import get_current_subscribed_user
+from database import db
+from menu_utils import (
+    menu_change,
+    published_menu_version,
+    get_dish_changes,
+    refresh_public_menu_payloads,
+)
+from models import Dish, DishCreate, DishDelta
+
+router = APIRouter()
+
+@router.post("/dishes", response_model=Dish)
+async def create_dish(
+    dish_data: DishCreate,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    # Verify menu belongs to user
+    menu = await db.menus.find_one({"id": dish_data.menu_id})
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    restaurant = await db.restaurants.find_one({
+        "id": menu["restaurant_id"],
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    dish = Dish(**dish_data.dict())
+    async with menu_change(menu["id"]) as version:
+        dish.version = version
+        await db.dishes.insert_one(dish.dict())
+    await refresh_public_menu_payloads(menu["id"])
+    return dish
+
+@router.get("/dishes", response_model=Union[DishDelta, List[Dish]])
+async def get_dishes(
+    menu_id: str,
+    since: Optional[int] = None,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    # Verify menu belongs to user
+    menu = await db.menus.find_one({"id": menu_id})
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    restaurant = await db.restaurants.find_one({
+        "id": menu["restaurant_id"],
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    if since is None:
+        dishes = await db.dishes.find({"menu_id": menu_id}).to_list(1000)
+        return dishes
+    
+    # Delta sync: only dishes changed or deleted after the client's version
+    version = published_menu_version(menu)
+    if since > version:
+        # Client is ahead of the server (e.g. menu recreated), resync everything
+        dishes = await db.dishes.find({"menu_id": menu_id}, {"_id": 0}).to_list(1000)
+        return {"version": version, "full": True, "dishes": dishes, "deleted": []}
+    
+    dishes, deleted = await get_dish_changes(menu_id, since)
+    return {"version": version, "dishes": dishes, "deleted": deleted}
+
+@router.put("/dishes/{dish_id}", response_model=Dish)
+async def update_dish(
+    dish_id: str,
+    dish_data: DishCreate,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    dish = await db.dishes.find_one({"id": dish_id})
+    if not dish:
+        raise HTTPException(status_code=404, detail="Dish not found")
+    
+    # Verify dish belongs to user's menu
+    menu = await db.menus.find_one({"id": dish["menu_id"]})
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    restaurant = await db.restaurants.find_one({
+        "id": menu["restaurant_id"],
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Dish not found")
+    
+    if dish_data.menu_id == menu["id"]:
+        async with menu_change(menu["id"]) as version:
+            await db.dishes.update_one(
+                {"id": dish_id},
+                {
+                    "$set": {
+                        **dish_data.dict(),
+                        "version": version,
+                        "updated_at": datetime.utcnow()
+                    }
+                }
+            )
+        await refresh_public_menu_payloads(menu["id"])
+        
+        updated_dish = await db.dishes.find_one({"id": dish_id})
+        return updated_dish
+    
+    # Moving to another menu is a delete from the old menu and a create in the new one
+    new_menu = await db.menus.find_one({"id": dish_data.menu_id})
+    if not new_menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    new_restaurant = await db.restaurants.find_one({
+        "id": new_menu["restaurant_id"],
+        "user_id": current_user["id"]
+    })
+    if not new_restaurant:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    async with menu_change(menu["id"]) as old_version, menu_change(new_menu["id"]) as new_version:
+        await db.dishes.update_one(
+            {"id": dish_id},
+            {
+                "$set": {
+                    **dish_data.dict(),
+                    "version": new_version,
+                    "updated_at": datetime.utcnow()
+                }
+            }
+        )
+        # A tombstone left by an earlier move out of the new menu is superseded by the dish itself
+        await db.dish_tombstones.delete_many({"menu_id": new_menu["id"], "dish_id": dish_id})
+        await db.dish_tombstones.insert_one({
+            "menu_id": menu["id"],
+            "dish_id": dish_id,
+            "version": old_version,
+            "deleted_at": datetime.utcnow()
+        })
+    await refresh_public_menu_payloads(menu["id"])
+    await refresh_public_menu_payloads(new_menu["id"])
+    
+    updated_dish = await db.dishes.find_one({"id": dish_id})
+    return updated_dish
+
+@router.delete("/dishes/{dish_id}")
+async def delete_dish(
+    dish_id: str,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    dish = await db.dishes.find_one({"id": dish_id})
+    if not dish:
+        raise HTTPException(status_code=404, detail="Dish not found")
+    
+    # Verify dish belongs to user's menu
+    menu = await db.menus.find_one({"id": dish["menu_id"]})
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    restaurant = await db.restaurants.find_one({
+        "id": menu["restaurant_id"],
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Dish not found")
+    
+    async with menu_change(menu["id"]) as version:
+        await db.dishes.delete_one({"id": dish_id})
+        
+        # Keep a tombstone so delta sync clients learn about the delete
+        await db.dish_tombstones.insert_one({
+            "menu_id": menu["id"],
+            "dish_id": dish_id,
+            "version": version,
+            "deleted_at": datetime.utcnow()
+        })
+    await refresh_public_menu_payloads(menu["id"])
+    return {"message": "Dish deleted successfully"}
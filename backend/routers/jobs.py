@@ -0,0 +1,13 @@
+from fastapi import APIRouter, HTTPException, Depends
+
+from auth import get_current_active_user
+from database import db
+
+router = APIRouter()
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str, current_user: dict = Depends(get_current_active_user)):
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0, "payload": 0, "locked_until": 0})
+    if not job or (job.get("user_id") != current_user["id"] and not current_user.get("is_admin")):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -0,0 +1,152 @@
+from fastapi import APIRouter, HTTPException, Depends, status, Response
+from typing import List
+from datetime import datetime
+import asyncio
+
+from auth import get_current_subscribed_user
+from database import db
+from jobs import job_handler, enqueue_job
+from menu_utils import (
+    generate_qr_code,
+    menu_change,
+    reserve_menu_version,
+    publish_menu_version,
+    refresh_public_menu_payloads,
+    delete_public_menu_payloads,
+)
+from models import Menu, MenuCreate
+
+router = APIRouter()
+
+@job_handler("render_menu_qr")
+async def render_menu_qr(menu_id: str):
+    public_menu_url = f"https://spaceqrpro.com/menu/{menu_id}"  # This will be the public URL
+    qr_code = await asyncio.to_thread(generate_qr_code, public_menu_url)
+    
+    version = await reserve_menu_version(menu_id)
+    if version is not None:
+        try:
+            await db.menus.update_one(
+                {"id": menu_id},
+                {"$set": {"qr_code": qr_code}, "$max": {"meta_version": version}}
+            )
+        finally:
+            await publish_menu_version(menu_id, version)
+        await refresh_public_menu_payloads(menu_id)
+    return {"menu_id": menu_id}
+
+@router.post("/menus", response_model=Menu, status_code=status.HTTP_202_ACCEPTED)
+async def create_menu(
+    menu_data: MenuCreate,
+    response: Response,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    # Verify restaurant belongs to user
+    restaurant = await db.restaurants.find_one({
+        "id": menu_data.restaurant_id,
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    
+    menu = Menu(**menu_data.dict())
+    
+    await db.menus.insert_one(menu.dict())
+    payloads = await refresh_public_menu_payloads(menu.id)
+    menu.available_locales = sorted(payloads)
+    
+    # Generate QR code for menu in the background
+    job = await enqueue_job("render_menu_qr", {"menu_id": menu.id}, user_id=current_user["id"])
+    response.headers["Location"] = f"/api/jobs/{job.id}"
+    return menu
+
+@router.get("/menus", response_model=List[Menu])
+async def get_menus(current_user: dict = Depends(get_current_subscribed_user)):
+    # Get all menus for user's restaurants
+    restaurants = await db.restaurants.find({"user_id": current_user["id"]}).to_list(1000)
+    restaurant_ids = [r["id"] for r in restaurants]
+    
+    menus = await db.menus.find({"restaurant_id": {"$in": restaurant_ids}}).to_list(1000)
+    return menus
+
+@router.get("/menus/{menu_id}", response_model=Menu)
+async def get_menu(
+    menu_id: str,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    menu = await db.menus.find_one({"id": menu_id})
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    # Verify menu belongs to user's restaurant
+    restaurant = await db.restaurants.find_one({
+        "id": menu["restaurant_id"],
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    return menu
+
+@router.put("/menus/{menu_id}", response_model=Menu)
+async def update_menu(
+    menu_id: str,
+    menu_data: MenuCreate,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    menu = await db.menus.find_one({"id": menu_id})
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    # Verify menu belongs to user's restaurant
+    restaurant = await db.restaurants.find_one({
+        "id": menu["restaurant_id"],
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    async with menu_change(menu_id) as version:
+        await db.menus.update_one(
+            {"id": menu_id},
+            {
+                "$set": {
+                    "name": menu_data.name,
+                    "default_locale": menu_data.default_locale,
+                    "translations": menu_data.dict()["translations"],
+                    "updated_at": datetime.utcnow()
+                },
+                "$max": {"meta_version": version}
+            }
+        )
+    await refresh_public_menu_payloads(menu_id)
+    
+    updated_menu = await db.menus.find_one({"id": menu_id})
+    return updated_menu
+
+@router.delete("/menus/{menu_id}")
+async def delete_menu(
+    menu_id: str,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    menu = await db.menus.find_one({"id": menu_id})
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    # Verify menu belongs to user's restaurant
+    restaurant = await db.restaurants.find_one({
+        "id": menu["restaurant_id"],
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    # Delete all dishes for this menu
+    await db.dishes.delete_many({"menu_id": menu_id})
+    await db.dish_tombstones.delete_many({"menu_id": menu_id})
+    await delete_public_menu_payloads([menu_id])
+    
+    # Delete the menu
+    await db.menus.delete_one({"id": menu_id})
+    
+    return {"message": "Menu deleted successfully"}
@@ -0,0 +1,83 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+from typing import Optional
+
+from database import db
+from menu_utils import (
+    published_menu_version,
+    get_dish_changes,
+    negotiate_locale,
+    public_menu,
+    public_restaurant,
+    public_dish,
+    decode_data_url,
+    get_public_menu_payload,
+)
+
+router = APIRouter()
+
+@router.get("/public/menu/{menu_id}")
+async def get_public_menu(
+    menu_id: str,
+    request: Request,
+    response: Response,
+    since: Optional[int] = None
+):
+    menu = await db.menus.find_one({"id": menu_id, "is_active": True}, {"_id": 0})
+    if not menu:
+        raise HTTPException(status_code=404, detail="Menu not found")
+    
+    locale = negotiate_locale(request.headers.get("Accept-Language"), menu)
+    response.headers["Content-Language"] = locale
+    response.headers["Vary"] = "Accept-Language"
+    
+    version = published_menu_version(menu)
+    if since is not None and since <= version:
+        # Menu and restaurant are only sent again when they changed since, null otherwise.
+        # Without a meta_version (menus older than it) any newer version counts as a change.
+        menu_payload = restaurant_payload = None
+        if menu.get("meta_version", version) > since:
+            restaurant = await db.restaurants.find_one({"id": menu["restaurant_id"]}, {"_id": 0})
+            if not restaurant:
+                raise HTTPException(status_code=404, detail="Restaurant not found")
+            menu_payload = public_menu(menu, locale)
+            restaurant_payload = public_restaurant(restaurant)
+        
+        # Delta sync: dishes that became unavailable are deleted from the diner's view
+        changed, deleted = await get_dish_changes(menu_id, since)
+        dishes = [public_dish(d, locale) for d in changed if d.get("is_available", True)]
+        deleted += [d["id"] for d in changed if not d.get("is_available", True)]
+        return {
+            "menu": menu_payload,
+            "restaurant": restaurant_payload,
+            "version": version,
+            "locale": locale,
+            "dishes": dishes,
+            "deleted": deleted
+        }
+    
+    payload = await get_public_menu_payload(menu, locale)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    return payload
+
+def image_response(data_url: Optional[str]) -> Response:
+    image = decode_data_url(data_url)
+    if image is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    media_type, content = image
+    # Image URLs carry a version, a changed image gets a new URL
+    return Response(content=content, media_type=media_type, headers={"Cache-Control": "public, max-age=86400"})
+
+@router.get("/public/dish/{dish_id}/image")
+async def get_public_dish_image(dish_id: str):
+    dish = await db.dishes.find_one({"id": dish_id}, {"_id": 0, "menu_id": 1, "image": 1})
+    if not dish or not await db.menus.find_one({"id": dish["menu_id"], "is_active": True}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Dish not found")
+    return image_response(dish.get("image"))
+
+@router.get("/public/restaurant/{restaurant_id}/logo")
+async def get_public_restaurant_logo(restaurant_id: str):
+    restaurant = await db.restaurants.find_one({"id": restaurant_id}, {"_id": 0, "logo": 1})
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    return image_response(restaurant.get("logo"))
@@ -0,0 +1,127 @@
+from fastapi import APIRouter, HTTPException, Depends, status, Response
+from typing import List
+from datetime import datetime
+
+from auth import get_current_subscribed_user
+from database import db
+from jobs import job_handler, enqueue_job
+from menu_utils import (
+    reserve_menu_version,
+    publish_menu_version,
+    refresh_public_menu_payloads,
+    delete_public_menu_payloads,
+)
+from models import Restaurant, RestaurantCreate
+
+router = APIRouter()
+
+@job_handler("delete_restaurant_menus")
+async def delete_restaurant_menus(restaurant_id: str):
+    menus = await db.menus.find({"restaurant_id": restaurant_id}).to_list(1000)
+    for menu in menus:
+        await db.dishes.delete_many({"menu_id": menu["id"]})
+        await db.dish_tombstones.delete_many({"menu_id": menu["id"]})
+    await delete_public_menu_payloads([menu["id"] for menu in menus])
+    await db.menus.delete_many({"restaurant_id": restaurant_id})
+    return {"restaurant_id": restaurant_id, "deleted_menus": len(menus)}
+
+@router.post("/restaurants", response_model=Restaurant)
+async def create_restaurant(
+    restaurant_data: RestaurantCreate,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    restaurant = Restaurant(
+        user_id=current_user["id"],
+        **restaurant_data.dict()
+    )
+    
+    await db.restaurants.insert_one(restaurant.dict())
+    return restaurant
+
+@router.get("/restaurants", response_model=List[Restaurant])
+async def get_restaurants(current_user: dict = Depends(get_current_subscribed_user)):
+    restaurants = await db.restaurants.find({"user_id": current_user["id"]}).to_list(1000)
+    # Remove MongoDB ObjectId
+    return [{k: v for k, v in restaurant.items() if k != "_id"} for restaurant in restaurants]
+
+@router.get("/restaurants/{restaurant_id}", response_model=Restaurant)
+async def get_restaurant(
+    restaurant_id: str,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    restaurant = await db.restaurants.find_one({
+        "id": restaurant_id,
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    return restaurant
+
+@router.put("/restaurants/{restaurant_id}", response_model=Restaurant)
+async def update_restaurant(
+    restaurant_id: str,
+    restaurant_data: RestaurantCreate,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    restaurant = await db.restaurants.find_one({
+        "id": restaurant_id,
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    
+    # The restaurant is embedded in every public menu payload, so it is a change to each menu
+    menus = await db.menus.find({"restaurant_id": restaurant_id}).to_list(1000)
+    versions = {menu["id"]: await reserve_menu_version(menu["id"]) for menu in menus}
+    
+    try:
+        await db.restaurants.update_one(
+            {"id": restaurant_id},
+            {
+                "$set": {
+                    **restaurant_data.dict(),
+                    "updated_at": datetime.utcnow()
+                }
+            }
+        )
+        for menu_id, version in versions.items():
+            if version is not None:
+                await db.menus.update_one({"id": menu_id}, {"$max": {"meta_version": version}})
+    finally:
+        for menu_id, version in versions.items():
+            if version is not None:
+                await publish_menu_version(menu_id, version)
+    
+    for menu_id, version in versions.items():
+        if version is not None:
+            await refresh_public_menu_payloads(menu_id)
+    
+    updated_restaurant = await db.restaurants.find_one({"id": restaurant_id})
+    return updated_restaurant
+
+@router.delete("/restaurants/{restaurant_id}", status_code=status.HTTP_202_ACCEPTED)
+async def delete_restaurant(
+    restaurant_id: str,
+    response: Response,
+    current_user: dict = Depends(get_current_subscribed_user)
+):
+    restaurant = await db.restaurants.find_one({
+        "id": restaurant_id,
+        "user_id": current_user["id"]
+    })
+    if not restaurant:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    
+    # The cascade delete of menus and dishes runs as a job. It is enqueued first so
+    # a failure here cannot leave a deleted restaurant with orphaned menus.
+    job = await enqueue_job(
+        "delete_restaurant_menus",
+        {"restaurant_id": restaurant_id},
+        user_id=current_user["id"]
+    )
+    
+    # Take the menus offline now
+    await db.menus.update_many({"restaurant_id": restaurant_id}, {"$set": {"is_active": False}})
+    await db.restaurants.delete_one({"id": restaurant_id})
+    response.headers["Location"] = f"/api/jobs/{job.id}"
+    return {"message": "Restaurant deleted successfully", "job_id": job.id}
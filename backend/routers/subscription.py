@@ -0,0 +1,156 @@
+from fastapi import APIRouter, HTTPException, Depends, status, Request, Response
+from datetime import datetime
+
+from auth import get_current_active_user
+from config import STRIPE_API_KEY, SUBSCRIPTION_PRICE
+from database import db
+from jobs import job_handler, enqueue_job
+from models import PaymentTransaction, SubscriptionRequest
+
+router = APIRouter()
+
+def get_stripe_checkout(webhook_url: str = ""):
+    # The Stripe integration is heavy and only these routes need it, import it on first use
+    from emergentintegrations.payments.stripe.checkout import StripeCheckout
+    return StripeCheckout(api_key=STRIPE_API_KEY, webhook_url=webhook_url)
+
+@job_handler("check_checkout_status")
+async def check_checkout_status(session_id: str, user_id: str):
+    stripe_checkout = get_stripe_checkout()
+    status_response = await stripe_checkout.get_checkout_status(session_id)
+    
+    # Update transaction status
+    transaction = await db.payment_transactions.find_one({"session_id": session_id})
+    if transaction:
+        await db.payment_transactions.update_one(
+            {"session_id": session_id},
+            {
+                "$set": {
+                    "payment_status": status_response.payment_status,
+                    "updated_at": datetime.utcnow()
+                }
+            }
+        )
+        
+        # Update user subscription status if payment successful
+        if status_response.payment_status == "paid":
+            await db.users.update_one(
+                {"id": user_id},
+                {
+                    "$set": {
+                        "subscription_status": "active",
+                        "subscription_session_id": session_id,
+                        "updated_at": datetime.utcnow()
+                    }
+                }
+            )
+    
+    return status_response.dict()
+
+@router.post("/subscription/create-checkout")
+async def create_subscription_checkout(
+    request: SubscriptionRequest,
+    current_user: dict = Depends(get_current_active_user)
+):
+    if not STRIPE_API_KEY:
+        raise HTTPException(status_code=500, detail="Stripe not configured")
+    
+    from emergentintegrations.payments.stripe.checkout import CheckoutSessionRequest
+    
+    # Initialize Stripe checkout
+    webhook_url = f"{request.host_url}/api/webhook/stripe"
+    stripe_checkout = get_stripe_checkout(webhook_url)
+    
+    # Create checkout session
+    success_url = f"{request.host_url}/dashboard?session_id={{CHECKOUT_SESSION_ID}}"
+    cancel_url = f"{request.host_url}/subscription"
+    
+    checkout_request = CheckoutSessionRequest(
+        amount=SUBSCRIPTION_PRICE,
+        currency="eur",
+        success_url=success_url,
+        cancel_url=cancel_url,
+        metadata={
+            "user_id": current_user["id"],
+            "user_email": current_user["email"],
+            "subscription_type": "monthly"
+        }
+    )
+    
+    session = await stripe_checkout.create_checkout_session(checkout_request)
+    
+    # Create payment transaction record
+    transaction = PaymentTransaction(
+        user_id=current_user["id"],
+        session_id=session.session_id,
+        amount=SUBSCRIPTION_PRICE,
+        currency="eur",
+        payment_status="pending",
+        metadata=checkout_request.metadata
+    )
+    
+    await db.payment_transactions.insert_one(transaction.dict())
+    
+    return {"checkout_url": session.url, "session_id": session.session_id}
+
+@router.get("/subscription/status/{session_id}")
+async def get_subscription_status(
+    session_id: str,
+    response: Response,
+    current_user: dict = Depends(get_current_active_user)
+):
+    if not STRIPE_API_KEY:
+        raise HTTPException(status_code=500, detail="Stripe not configured")
+    
+    # The webhook may already have settled the payment, no need to ask Stripe again
+    transaction = await db.payment_transactions.find_one({"session_id": session_id})
+    if transaction and transaction.get("payment_status") == "paid":
+        return {"session_id": session_id, "payment_status": "paid"}
+    
+    job = await enqueue_job(
+        "check_checkout_status",
+        {"session_id": session_id, "user_id": current_user["id"]},
+        user_id=current_user["id"]
+    )
+    response.status_code = status.HTTP_202_ACCEPTED
+    response.headers["Location"] = f"/api/jobs/{job.id}"
+    return {"session_id": session_id, "job_id": job.id, "status": job.status}
+
+@router.post("/webhook/stripe")
+async def stripe_webhook(request: Request):
+    if not STRIPE_API_KEY:
+        raise HTTPException(status_code=500, detail="Stripe not configured")
+    
+    body = await request.body()
+    signature = request.headers.get("Stripe-Signature")
+    
+    stripe_checkout = get_stripe_checkout()
+    webhook_response = await stripe_checkout.handle_webhook(body, signature)
+    
+    # Update transaction and user based on webhook
+    if webhook_response.event_type == "checkout.session.completed":
+        await db.payment_transactions.update_one(
+            {"session_id": webhook_response.session_id},
+            {
+                "$set": {
+                    "payment_status": webhook_response.payment_status,
+                    "updated_at": datetime.utcnow()
+                }
+            }
+        )
+        
+        if webhook_response.payment_status == "paid":
+            user_id = webhook_response.metadata.get("user_id")
+            if user_id:
+                await db.users.update_one(
+                    {"id": user_id},
+                    {
+                        "$set": {
+                            "subscription_status": "active",
+                            "subscription_session_id": webhook_response.session_id,
+                            "updated_at": datetime.utcnow()
+                        }
+                    }
+                )
+    
+    return {"status": "success"}
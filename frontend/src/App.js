@@ -30,6 +30,18 @@ import './App.css';
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
+// Poll a background job until it finishes and return its result
+const waitForJob = async (jobId, { interval = 1000, timeout = 60000 } = {}) => {
+  const deadline = Date.now() + timeout;
+  while (Date.now() < deadline) {
+    const { data } = await axios.get(`${API}/jobs/${jobId}`);
+    if (data.status === 'succeeded') return data.result;
+    if (data.status === 'failed') throw new Error(data.error || 'Job failed');
+    await new Promise(resolve => setTimeout(resolve, interval));
+  }
+  throw new Error('Job timed out');
+};
+
 // Auth Context
 const AuthContext = createContext();
 
@@ -366,7 +378,8 @@ const Dashboard = () => {
   const checkPaymentStatus = async (sessionId) => {
     try {
       const response = await axios.get(`${API}/subscription/status/${sessionId}`);
-      if (response.data.payment_status === 'paid') {
+      const result = response.status === 202 ? await waitForJob(response.data.job_id) : response.data;
+      if (result.payment_status === 'paid') {
         // Refresh user data
         window.location.reload();
       } else {
@@ -405,9 +418,16 @@ const Dashboard = () => {
 
   const handleCreateMenu = (formData) => {
     axios.post(`${API}/menus`, formData)
-      .then(response => {
+      .then(async response => {
         setMenus([...menus, response.data]);
         setShowModal(false);
+        
+        // The QR code is rendered in the background, fetch the menu again once it is ready
+        if (response.headers.location) {
+          await waitForJob(response.headers.location.split('/').pop());
+          const menuRes = await axios.get(`${API}/menus/${response.data.id}`);
+          setMenus(current => current.map(m => m.id === menuRes.data.id ? menuRes.data : m));
+        }
       })
       .catch(error => console.error('Error creating menu:', error));
   };
@@ -956,8 +976,8 @@ const PublicMenu = () => {
   return (
     <div className="public-menu">
       <div className="menu-header">
-        {restaurant.logo && (
-          <img src={restaurant.logo} alt={restaurant.name} className="restaurant-logo" />
+        {restaurant.logo_url && (
+          <img src={`${BACKEND_URL}${restaurant.logo_url}`} alt={restaurant.name} className="restaurant-logo" />
         )}
         <h1>{restaurant.name}</h1>
         <p className="restaurant-info">{restaurant.address}</p>
@@ -968,8 +988,8 @@ const PublicMenu = () => {
       <div className="menu-dishes">
         {dishes.map(dish => (
           <div key={dish.id} className="menu-dish">
-            {dish.image && (
-              <img src={dish.image} alt={dish.name} className="menu-dish-image" />
+            {dish.image_url && (
+              <img src={`${BACKEND_URL}${dish.image_url}`} alt={dish.name} className="menu-dish-image" />
             )}
             <div className="menu-dish-info">
               <h3>{dish.name}</h3>
@@ -0,0 +1,21 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+import benchmark_startup  # noqa: E402
+
+pytest.importorskip("fastapi", reason="backend requirements are not installed")
+pytest.importorskip("motor", reason="backend requirements are not installed")
+
+# Budgets per worker, overridable for slower CI machines
+MAX_IMPORT_MS = float(os.environ.get("STARTUP_MAX_IMPORT_MS", "2000"))
+MAX_RSS_MB = float(os.environ.get("STARTUP_MAX_RSS_MB", "120"))
+
+def test_startup_within_budgets():
+    result = benchmark_startup.run_benchmark(runs=3)
+    assert benchmark_startup.check_budgets(result, MAX_IMPORT_MS, MAX_RSS_MB) == []